@@ -7,7 +7,7 @@ and AWS Secret Access Key and supports customization of the pre-trained model, s
 
 Example usage:
 
-    from semantic_router.encoders.bedrock_encoder import BedrockEncoder
+    from semantic_router.encoders import BedrockEncoder
 
     encoder = BedrockEncoder(aws_access_key_id="your-access-key-id", aws_secret_access_key="your-secret-key", region="your-region")
     embeddings = encoder(["document1", "document2"])
@@ -15,13 +15,73 @@ Example usage:
 Classes:
     BedrockEncoder: A class for generating embeddings using the Bedrock Platform.
 """
+
+import asyncio
+import base64
+import hashlib
 import json
 import os
-import boto3
-from typing import Any, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from pydantic.v1 import Field, PrivateAttr
 
 from semantic_router.encoders import BaseEncoder
-from defaults import EncoderDefault
+from semantic_router.utils.defaults import EncoderDefault
+from semantic_router.utils.logger import logger
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson is optional, fall back to the (slower) standard library encoder.
+    def _json_dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+def _parse_embedding(body: bytes, key: str) -> Any:
+    """Decodes an `invoke_model` response body and returns the field at `key`.
+
+    A vector returned base64-encoded under `embeddingBase64` is decoded directly
+    into a little-endian float32 array, skipping the float list parsing. Typed
+    Cohere embeddings, returned as `{type: embeddings}`, are unwrapped.
+    """
+    response = _json_loads(body)
+    if "embeddingBase64" in response:
+        return np.frombuffer(base64.b64decode(response["embeddingBase64"]), dtype="<f4")
+    embeddings = response[key]
+    if isinstance(embeddings, dict):
+        # only a single embedding type is ever requested
+        return next(iter(embeddings.values()))
+    return embeddings
+
+
+# Maximum number of texts accepted by a single Cohere embed request.
+COHERE_MAX_BATCH_SIZE = 96
+# Maximum number of characters accepted per text, checked before any request is
+# sent so that oversized documents do not cost a failed round-trip.
+MAX_CHARS = {
+    "cohere.embed-english-v3": 2048,
+    "amazon.titan-embed-text-v1": 25000,
+    "amazon.titan-embed-text-v2:0": 50000,
+}
+# Model IDs that accept `performanceConfigLatency="optimized"`. AWS has not yet
+# enabled latency-optimized inference for any Bedrock embedding model, add model
+# IDs here as support becomes available.
+LATENCY_OPTIMIZED_MODELS: Set[str] = set()
+# Output sizes supported by Titan text embeddings v2.
+TITAN_V2_DIMENSIONS = (256, 512, 1024)
+# Cohere embedding types that can be dequantized to float32 with a plain cast.
+COHERE_EMBEDDING_TYPES = ("float", "int8")
+
+# (model name, input type or "" for Titan, document digest)
+CacheKey = Tuple[str, str, bytes]
 
 
 class BedrockEncoder(BaseEncoder):
@@ -32,8 +92,30 @@ class BedrockEncoder(BaseEncoder):
         type: The type of the encoder, which is "bedrock".
     """
 
-    client: Optional[Any] = None
+    # the model ID, latency profile, embedding type and Titan parameters shape
+    # the precomputed requests and the cached vectors, so they cannot be
+    # reassigned after init
+    name: str = Field(allow_mutation=False)
+    client: Any = None
     type: str = "bedrock"
+    max_workers: int = 8
+    performance_config: Optional[str] = Field(default=None, allow_mutation=False)
+    cache_size: int = 4096
+    dimensions: int = Field(default=512, allow_mutation=False)
+    normalize: bool = Field(default=True, allow_mutation=False)
+    embedding_type: str = Field(default="float", allow_mutation=False)
+    _cache: "OrderedDict[CacheKey, np.ndarray]" = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _invoke_kwargs: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _titan_body_suffix: bytes = PrivateAttr(default=b"}")
+    _session_kwargs: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _async_session: Optional[Any] = PrivateAttr(default=None)
+    _client_config: Optional[Any] = PrivateAttr(default=None)
+
+    class Config:
+        # enforces `allow_mutation=False` on the request-shaping fields
+        validate_assignment = True
 
     def __init__(
         self,
@@ -42,6 +124,12 @@ class BedrockEncoder(BaseEncoder):
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         region: Optional[str] = None,
+        max_workers: int = 8,
+        performance_config: Optional[str] = None,
+        cache_size: int = 4096,
+        dimensions: int = 512,
+        normalize: bool = True,
+        embedding_type: str = "float",
     ):
         """Initializes the BedrockEncoder.
 
@@ -59,16 +147,98 @@ class BedrockEncoder(BaseEncoder):
             region: The location of the Bedrock resources.
                 If not provided, it will be retrieved from the AWS_REGION
                 environment variable, defaulting to "us-west-2"
+            max_workers: The maximum number of concurrent requests used when
+                embedding documents with a single-text model such as Titan.
+            performance_config: The Bedrock inference latency profile, either
+                "standard" or "optimized". "optimized" is only sent for models
+                listed in LATENCY_OPTIMIZED_MODELS.
+            cache_size: The maximum number of document embeddings kept in the
+                in-process LRU cache, repeated documents are served from the cache
+                instead of calling Bedrock again. Set to 0 to disable caching.
+            dimensions: The embedding size returned by Titan text embeddings v2,
+                one of 256, 512 or 1024. Ignored by other models.
+            normalize: Whether Titan text embeddings v2 should return unit length
+                vectors. Ignored by other models.
+            embedding_type: The Cohere embedding type, either "float" or "int8".
+                int8 embeddings are a quarter of the response size and are cast to
+                float32 on arrival. Ignored by other models.
 
         Raises:
-            ValueError: If the Bedrock Platform client fails to initialize.
+            ValueError: If the model, max workers, performance config, dimensions
+            or embedding type is not supported or if
+            the Bedrock Platform client fails to initialize.
         """
         if model_id is None:
             model_id = EncoderDefault.BEDROCK.value["embedding_model"]
 
-        super().__init__(name=model_id, score_threshold=score_threshold)
+        if model_id != "cohere.embed-english-v3" and not model_id.startswith(
+            "amazon.titan-embed"
+        ):
+            raise ValueError(
+                f"Unsupported Bedrock embedding model: {model_id}. Choose either "
+                "'cohere.embed-english-v3' or an Amazon Titan embedding model."
+            )
+
+        if max_workers < 1:
+            raise ValueError(
+                f"Unsupported max_workers: {max_workers}. Choose at least 1."
+            )
+
+        if performance_config not in (None, "standard", "optimized"):
+            raise ValueError(
+                f"Unsupported performance config: {performance_config}. "
+                "Choose either 'standard' or 'optimized'."
+            )
+
+        if embedding_type not in COHERE_EMBEDDING_TYPES:
+            raise ValueError(
+                f"Unsupported embedding type: {embedding_type}. "
+                f"Choose one of {COHERE_EMBEDDING_TYPES}."
+            )
 
-        self.client = self._initialize_client(aws_access_key_id, aws_secret_access_key, region)
+        is_titan_v2 = model_id.startswith("amazon.titan-embed-text-v2")
+        if is_titan_v2 and dimensions not in TITAN_V2_DIMENSIONS:
+            raise ValueError(
+                f"Unsupported dimensions: {dimensions}. "
+                f"Choose one of {TITAN_V2_DIMENSIONS}."
+            )
+
+        super().__init__(
+            name=model_id,
+            score_threshold=score_threshold,
+            max_workers=max_workers,  # type: ignore
+            performance_config=performance_config,  # type: ignore
+            cache_size=cache_size,  # type: ignore
+            dimensions=dimensions,  # type: ignore
+            normalize=normalize,  # type: ignore
+            embedding_type=embedding_type,  # type: ignore
+        )
+
+        if is_titan_v2:
+            # the fixed fields are encoded once, only the document varies per request
+            params = _json_dumps({"dimensions": dimensions, "normalize": normalize})
+            self._titan_body_suffix = b"," + params[1:]
+
+        self._invoke_kwargs = {
+            "contentType": "application/json",
+            "accept": "application/json",
+            "modelId": model_id,
+        }
+        if performance_config is not None:
+            # "standard" is the Bedrock default and is accepted by every model
+            if performance_config == "standard" or model_id in LATENCY_OPTIMIZED_MODELS:
+                self._invoke_kwargs["performanceConfigLatency"] = performance_config
+            else:
+                logger.warning(
+                    f"Model `{model_id}` does not support latency-optimized "
+                    "inference, ignoring performance_config."
+                )
+
+        self.client = self._initialize_client(
+            aws_access_key_id, aws_secret_access_key, region
+        )
+        if self.client is None:
+            raise ValueError("Bedrock client is not initialized.")
 
     def _initialize_client(self, aws_access_key_id, aws_secret_access_key, region):
         """Initializes the Bedrock client.
@@ -88,6 +258,7 @@ class BedrockEncoder(BaseEncoder):
         """
         try:
             from boto3 import client
+            from botocore.config import Config
         except ImportError:
             raise ImportError(
                 "Please install Amazon's Boto3 client library to use the BedrockEncoder. "
@@ -105,12 +276,27 @@ class BedrockEncoder(BaseEncoder):
         if aws_secret_key is None:
             raise ValueError("AWS secret access key cannot be 'None'.")
 
+        # kept so that `acall` can lazily build an aioboto3 session
+        self._session_kwargs = {
+            "aws_access_key_id": aws_access_key_id,
+            "aws_secret_access_key": aws_secret_key,
+            "region_name": region,
+        }
+
+        # size the connection pool for the concurrent fan-out in `__call__` and
+        # `acall`, and use adaptive retries to back off when Bedrock throttles
+        self._client_config = Config(
+            max_pool_connections=max(64, self.max_workers),
+            retries={"max_attempts": 5, "mode": "adaptive"},
+            tcp_keepalive=True,
+            connect_timeout=3,
+            read_timeout=30,
+        )
+
         try:
-            bedrock_client = boto3.client('bedrock-runtime',
-                                          aws_access_key_id=aws_access_key_id,
-                                          aws_secret_access_key=aws_secret_access_key,
-                                          region_name=region
-                                          )
+            bedrock_client = client(
+                "bedrock-runtime", config=self._client_config, **self._session_kwargs
+            )
         except Exception as err:
             raise ValueError(
                 f"The Bedrock client failed to initialize. Error: {err}"
@@ -118,83 +304,296 @@ class BedrockEncoder(BaseEncoder):
 
         return bedrock_client
 
-    def __call__(self, docs: List[str]) -> List[List[float]]:
+    def __call__(  # type: ignore[override]
+        self, docs: List[str], input_type: str = "search_document"
+    ) -> np.ndarray:
         """Generates embeddings for the given documents.
 
         Args:
             docs: A list of strings representing the documents to embed.
+            input_type: The Cohere input type, "search_document" for utterances
+                stored in the index. Ignored by Titan models.
+
+        Returns:
+            A float32 array of shape (len(docs), dimensions), where each row contains
+            the embedding values for a document.
+
+        Raises:
+            ValueError: If a document is empty or exceeds the model's character
+            limit or if the API call fails.
+        """
+        if not docs:
+            return np.empty((0, 0), dtype=np.float32)
+
+        self._check_docs(docs)
+
+        if self.cache_size <= 0:
+            return self._embed(docs, input_type)
+        keys, cached, missing = self._cache_lookup(docs, input_type)
+        embeddings = self._embed(list(missing.values()), input_type) if missing else []
+        return self._cache_merge(keys, cached, missing, embeddings)
+
+    def query(self, docs: List[str]) -> np.ndarray:
+        """Generates embeddings for search queries, which Cohere embeds with the
+        "search_query" input type to match against indexed utterances."""
+        return self(docs, input_type="search_query")
+
+    def _embed(self, docs: List[str], input_type: str) -> np.ndarray:
+        """Generates embeddings for the given documents, bypassing the cache."""
+        # reallocated once the first response reveals the embedding dimensions
+        embeddings = np.empty((0, 0), dtype=np.float32)
+        if self.name == "cohere.embed-english-v3":
+            for i in range(0, len(docs), COHERE_MAX_BATCH_SIZE):
+                batch = self._embed_cohere(
+                    docs[i : i + COHERE_MAX_BATCH_SIZE], input_type
+                )
+                if i == 0:
+                    embeddings = np.empty((len(docs), len(batch[0])), dtype=np.float32)
+                embeddings[i : i + len(batch)] = batch
+        else:
+            # Titan only embeds a single text per request, so fan the requests out
+            # over a thread pool and write each vector into its row as it arrives
+            max_workers = min(self.max_workers, len(docs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._embed_titan, doc): i
+                    for i, doc in enumerate(docs)
+                }
+                try:
+                    for future in as_completed(futures):
+                        embedding = future.result()
+                        if embeddings.size == 0:
+                            embeddings = np.empty(
+                                (len(docs), len(embedding)), dtype=np.float32
+                            )
+                        embeddings[futures[future]] = embedding
+                finally:
+                    for future in futures:
+                        future.cancel()
+        return embeddings
+
+    def _embed_cohere(self, texts: List[str], input_type: str) -> List[List[float]]:
+        """Generates the Cohere embeddings for a batch of documents.
+
+        Args:
+            texts: The documents to embed, at most COHERE_MAX_BATCH_SIZE of them.
+            input_type: The Cohere input type.
 
         Returns:
             A list of lists, where each inner list contains the embedding values for a
             document.
 
         Raises:
-            ValueError: If the Bedrock Platform client is not initialized or if the
-            API call fails.
+            ValueError: If the API call fails.
         """
-        if self.client is None:
-            raise ValueError("Bedrock client is not initialized.")
+        try:
+            embedding = self.client.invoke_model(
+                body=self._cohere_body(texts, input_type), **self._invoke_kwargs
+            )
+            return _parse_embedding(embedding["body"].read(), "embeddings")
+        except Exception as e:
+            raise ValueError(f"Bedrock Platform API call failed. Error: {e}") from e
 
-        responses = []
+    def _embed_titan(self, doc: str) -> List[float]:
+        """Generates the Titan embedding for a single document.
 
-        def chunk_strings(strings, max_chunk_size=75):
-            """
-            Breaks up a list of strings into smaller chunks.
+        Args:
+            doc: The document to embed.
 
-            Args:
-                strings (list): A list of strings to be chunked.
-                max_chunk_size (int): The maximum size of each chunk. Default is 75.
+        Returns:
+            The embedding values for the document.
 
-            Returns:
-                list: A list of lists, where each inner list contains a chunk of strings.
-            """
-            chunked_strings = []
-            current_chunk = []
+        Raises:
+            ValueError: If the API call fails.
+        """
+        try:
+            embedding = self.client.invoke_model(
+                body=self._titan_body(doc), **self._invoke_kwargs
+            )
+            return _parse_embedding(embedding["body"].read(), "embedding")
+        except Exception as e:
+            raise ValueError(f"Bedrock Platform API call failed. Error: {e}") from e
 
-            for string in strings:
-                if len(current_chunk) >= max_chunk_size:
-                    chunked_strings.append(current_chunk)
-                    current_chunk = []
-                current_chunk.append(string)
+    async def acall(
+        self, docs: List[str], input_type: str = "search_document"
+    ) -> np.ndarray:
+        """Asynchronously generates embeddings for the given documents.
 
-            if current_chunk:
-                chunked_strings.append(current_chunk)
+        Requests are issued concurrently through an aioboto3 client, with at most
+        `max_workers` in flight at once.
 
-            return chunked_strings
+        Args:
+            docs: A list of strings representing the documents to embed.
+            input_type: The Cohere input type, "search_document" for utterances
+                stored in the index. Ignored by Titan models.
 
-        if self.name == "cohere.embed-english-v3":
-            chunked_docs = chunk_strings(docs)
-            for chunk in chunked_docs:
-                body = json.dumps(
-                    {
-                        "texts": chunk,
-                        "input_type": "clustering"
-                    }
+        Returns:
+            A float32 array of shape (len(docs), dimensions), where each row contains
+            the embedding values for a document.
+
+        Raises:
+            ImportError: If aioboto3 is not installed.
+            ValueError: If a document is empty or exceeds the model's character
+            limit or if the API call fails.
+        """
+        if not docs:
+            return np.empty((0, 0), dtype=np.float32)
+
+        self._check_docs(docs)
+
+        if self.cache_size <= 0:
+            return await self._aembed(docs, input_type)
+        keys, cached, missing = self._cache_lookup(docs, input_type)
+        embeddings = (
+            await self._aembed(list(missing.values()), input_type) if missing else []
+        )
+        return self._cache_merge(keys, cached, missing, embeddings)
+
+    async def _aembed(self, docs: List[str], input_type: str) -> np.ndarray:
+        """Asynchronously generates embeddings for the given documents, bypassing
+        the cache."""
+        if self._async_session is None:
+            try:
+                import aioboto3
+            except ImportError:
+                raise ImportError(
+                    "Please install aioboto3 to use BedrockEncoder asynchronously. "
+                    "You can install it with: "
+                    "`pip install aioboto3`"
                 )
-                accept = "*/*"
-                embedding = self.client.invoke_model(body=body,
-                                                      contentType="application/json",
-                                                      accept=accept,
-                                                      modelId=self.name
-                                                      )
-                r = json.loads(embedding.get('body').read())
-                for item in r.get('embeddings'):
-                    responses.append(item)
-        else:
-            for doc in docs:
-                body = json.dumps(
-                    {
-                        "inputText": doc,
-                    }
+            self._async_session = aioboto3.Session(**self._session_kwargs)
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async with self._async_session.client(
+            "bedrock-runtime", config=self._client_config
+        ) as client:
+
+            async def invoke(start: int, body: bytes, key: str) -> Tuple[int, Any]:
+                async with semaphore:
+                    try:
+                        response = await client.invoke_model(
+                            body=body, **self._invoke_kwargs
+                        )
+                        embedding = _parse_embedding(await response["body"].read(), key)
+                    except Exception as e:
+                        raise ValueError(
+                            f"Bedrock Platform API call failed. Error: {e}"
+                        ) from e
+                # Cohere returns a batch of vectors, Titan a single vector
+                return start, embedding if key == "embeddings" else [embedding]
+
+            if self.name == "cohere.embed-english-v3":
+                requests = [
+                    invoke(
+                        i,
+                        self._cohere_body(
+                            docs[i : i + COHERE_MAX_BATCH_SIZE], input_type
+                        ),
+                        "embeddings",
+                    )
+                    for i in range(0, len(docs), COHERE_MAX_BATCH_SIZE)
+                ]
+            else:
+                requests = [
+                    invoke(i, self._titan_body(doc), "embedding")
+                    for i, doc in enumerate(docs)
+                ]
+            tasks = [asyncio.ensure_future(request) for request in requests]
+
+            # write each response out as soon as it arrives rather than waiting on
+            # the slowest request before decoding any of them
+            embeddings = np.empty((0, 0), dtype=np.float32)
+            try:
+                for task in asyncio.as_completed(tasks):
+                    start, batch = await task
+                    if embeddings.size == 0:
+                        embeddings = np.empty(
+                            (len(docs), len(batch[0])), dtype=np.float32
+                        )
+                    embeddings[start : start + len(batch)] = batch
+            finally:
+                for task in tasks:
+                    task.cancel()
+            return embeddings
+
+    def _cache_key(self, doc: str, input_type: str) -> CacheKey:
+        """Returns the cache key of a document for the current model."""
+        digest = hashlib.blake2b(doc.encode(), digest_size=16).digest()
+        if self.name != "cohere.embed-english-v3":
+            # Titan ignores the input type, so documents and queries share entries
+            input_type = ""
+        return self.name, input_type, digest
+
+    def _cache_lookup(
+        self, docs: List[str], input_type: str
+    ) -> Tuple[List[CacheKey], List[Optional[np.ndarray]], Dict[CacheKey, str]]:
+        """Looks the documents up in the embedding cache.
+
+        Args:
+            docs: The documents to look up.
+            input_type: The input type the documents are embedded with.
+
+        Returns:
+            The cache key of every document, the cached embedding of every document
+            (None on a miss), and the uncached documents keyed by their cache key.
+            Repeated uncached documents appear only once.
+        """
+        keys = [self._cache_key(doc, input_type) for doc in docs]
+        cached: List[Optional[np.ndarray]] = [None] * len(docs)
+        missing: Dict[CacheKey, str] = {}
+        for i, (key, doc) in enumerate(zip(keys, docs)):
+            embedding = self._cache.get(key)
+            if embedding is None:
+                missing[key] = doc
+            else:
+                self._cache.move_to_end(key)
+                cached[i] = embedding
+        return keys, cached, missing
+
+    def _cache_merge(
+        self,
+        keys: List[CacheKey],
+        cached: List[Optional[np.ndarray]],
+        missing: Dict[CacheKey, str],
+        embeddings: Any,
+    ) -> np.ndarray:
+        """Caches the embeddings of the missing documents and stitches them together
+        with the cached embeddings in input order."""
+        new = dict(zip(missing, embeddings))
+        for key, embedding in new.items():
+            self._cache[key] = embedding.copy()
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return np.stack(
+            [
+                new[key] if embedding is None else embedding
+                for key, embedding in zip(keys, cached)
+            ]
+        )
+
+    def _check_docs(self, docs: List[str]):
+        """Raises a ValueError if any document is empty or exceeds the character
+        limit of the model."""
+        empty = [i for i, doc in enumerate(docs) if not doc]
+        if empty:
+            raise ValueError(f"Documents at indices {empty} are empty.")
+        max_chars = MAX_CHARS.get(self.name)
+        if max_chars is not None:
+            too_long = [i for i, doc in enumerate(docs) if len(doc) > max_chars]
+            if too_long:
+                raise ValueError(
+                    f"Documents at indices {too_long} exceed the {self.name} limit "
+                    f"of {max_chars} characters."
                 )
-                try:
-                    embedding = self.client.invoke_model(body=body,
-                                                         contentType="application/json",
-                                                         accept="application/json",
-                                                         modelId="amazon.titan-embed-text-v1"
-                                                         )
-                    r = json.loads(embedding.get('body').read())
-                    responses.append(r.get('embedding'))
-                except Exception as e:
-                    raise ValueError(f"Bedrock Platform API call failed. Error: {e}") from e
-        return responses
+
+    def _cohere_body(self, texts: List[str], input_type: str) -> bytes:
+        """Builds the Cohere embed request body for a batch of texts."""
+        body: Dict[str, Any] = {"texts": texts, "input_type": input_type}
+        if self.embedding_type != "float":
+            body["embedding_types"] = [self.embedding_type]
+        return _json_dumps(body)
+
+    def _titan_body(self, doc: str) -> bytes:
+        """Builds the Titan embed request body for a single document."""
+        return b'{"inputText":' + _json_dumps(doc) + self._titan_body_suffix
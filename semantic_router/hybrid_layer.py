@@ -209,7 +209,7 @@ class HybridRouteLayer:
             return "", []
 
     def _pass_threshold(self, scores: List[float], threshold: float) -> bool:
-        if scores:
+        if len(scores) > 0:
             return max(scores) > threshold
         else:
             return False
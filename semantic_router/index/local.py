@@ -68,15 +68,11 @@ class LocalIndex(BaseIndex):
         if self.index is None or self.routes is None:
             raise ValueError("Index or routes are not populated.")
         if route_filter is not None:
-            filtered_index = []
-            filtered_routes = []
-            for route, vec in zip(self.routes, self.index):
-                if route in route_filter:
-                    filtered_index.append(vec)
-                    filtered_routes.append(route)
-            if not filtered_routes:
+            mask = np.isin(self.routes, route_filter)
+            if not mask.any():
                 raise ValueError("No routes found matching the filter criteria.")
-            sim = similarity_matrix(vector, np.array(filtered_index))
+            filtered_routes = self.routes[mask]
+            sim = similarity_matrix(vector, self.index[mask])
             scores, idx = top_scores(sim, top_k)
             route_names = [filtered_routes[i] for i in idx]
         else:
@@ -153,6 +153,9 @@ class PineconeIndex(BaseIndex):
         batch_size: int = 100,
     ):
         """Add vectors to Pinecone in batches."""
+        if isinstance(embeddings, np.ndarray):
+            # records are validated and sent as plain lists of floats
+            embeddings = embeddings.tolist()
         if self.index is None:
             self.dimensions = self.dimensions or len(embeddings[0])
             self.index = self._init_index(force_create=True)
@@ -509,7 +509,7 @@ class RouteLayer:
         return scores_by_class
 
     def _pass_threshold(self, scores: List[float], threshold: float) -> bool:
-        if scores:
+        if len(scores) > 0:
             return max(scores) > threshold
         else:
             return False
@@ -15,7 +15,8 @@ def similarity_matrix(xq: np.ndarray, index: np.ndarray) -> np.ndarray:
         The similarity between the query vector and the set of vectors.
     """
 
-    index_norm = norm(index, axis=1)
+    # row norms via einsum avoid materialising a squared copy of the whole index
+    index_norm = np.sqrt(np.einsum("ij,ij->i", index, index))
     xq_norm = norm(xq.T)
     sim = np.dot(index, xq.T) / (index_norm * xq_norm)
     return sim
@@ -33,6 +33,6 @@ class EncoderDefault(Enum):
     }
     BEDROCK = {
         "embedding_model": os.getenv(
-            "BEDROCK_EMBEDDING_MODEL", "amazon.titan-embed-text-v1"
+            "BEDROCK_EMBEDDING_MODEL", "amazon.titan-embed-text-v2:0"
         ),
     }
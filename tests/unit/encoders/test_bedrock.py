@@ -0,0 +1,287 @@
+import asyncio
+import base64
+import io
+import json
+
+import numpy as np
+import pytest
+
+from semantic_router.encoders import BedrockEncoder
+
+
+def mock_invoke_model(**kwargs):
+    body = json.loads(kwargs["body"])
+    if "texts" in body:
+        response = {"embeddings": [[float(len(t)), 1.0] for t in body["texts"]]}
+    else:
+        response = {"embedding": [float(len(body["inputText"])), 1.0]}
+    return {"body": io.BytesIO(json.dumps(response).encode())}
+
+
+@pytest.fixture
+def bedrock_client(mocker):
+    client = mocker.MagicMock()
+    client.invoke_model.side_effect = mock_invoke_model
+    mocker.patch.object(BedrockEncoder, "_initialize_client", return_value=client)
+    return client
+
+
+@pytest.fixture
+def bedrock_encoder(bedrock_client):
+    return BedrockEncoder(aws_access_key_id="test_id", aws_secret_access_key="test_key")
+
+
+@pytest.fixture
+def cohere_encoder(bedrock_client):
+    return BedrockEncoder(
+        model_id="cohere.embed-english-v3",
+        aws_access_key_id="test_id",
+        aws_secret_access_key="test_key",
+    )
+
+
+@pytest.fixture
+def mock_boto3(mocker):
+    boto3 = mocker.MagicMock()
+    mocker.patch.dict(
+        "sys.modules",
+        {
+            "boto3": boto3,
+            "botocore": mocker.MagicMock(),
+            "botocore.config": mocker.MagicMock(),
+        },
+    )
+    return boto3
+
+
+class TestBedrockEncoder:
+    def test_initialization(self, bedrock_encoder):
+        assert bedrock_encoder.client is not None, "Client should be initialized"
+        assert (
+            bedrock_encoder.name == "amazon.titan-embed-text-v2:0"
+        ), "Default name not set correctly"
+
+    def test_initialization_without_credentials(self, mock_boto3, monkeypatch):
+        monkeypatch.delenv("AWS_ACCESS_KEY_ID", raising=False)
+        monkeypatch.delenv("AWS_SECRET_ACCESS_KEY", raising=False)
+        with pytest.raises(ValueError):
+            BedrockEncoder()
+
+    def test_raises_value_error_if_client_fails_to_initialize(self, mock_boto3):
+        mock_boto3.client.side_effect = Exception("Failed to initialize client")
+        with pytest.raises(ValueError):
+            BedrockEncoder(
+                aws_access_key_id="test_id", aws_secret_access_key="test_key"
+            )
+
+    def test_raises_value_error_for_unsupported_model(self, bedrock_client):
+        with pytest.raises(ValueError):
+            BedrockEncoder(
+                model_id="unsupported-model",
+                aws_access_key_id="test_id",
+                aws_secret_access_key="test_key",
+            )
+
+    def test_raises_value_error_for_non_positive_max_workers(self, bedrock_client):
+        with pytest.raises(ValueError):
+            BedrockEncoder(
+                max_workers=0,
+                aws_access_key_id="test_id",
+                aws_secret_access_key="test_key",
+            )
+
+    def test_model_cannot_be_reassigned(self, bedrock_encoder, bedrock_client):
+        with pytest.raises(TypeError):
+            bedrock_encoder.name = "cohere.embed-english-v3"
+        bedrock_encoder(["test"])
+        kwargs = bedrock_client.invoke_model.call_args.kwargs
+        assert kwargs["modelId"] == bedrock_encoder.name
+        assert "inputText" in json.loads(kwargs["body"])
+
+    def test_titan_parameters_cannot_be_reassigned(
+        self, bedrock_encoder, bedrock_client
+    ):
+        with pytest.raises(TypeError):
+            bedrock_encoder.dimensions = 256
+        with pytest.raises(TypeError):
+            bedrock_encoder.normalize = False
+        bedrock_encoder(["test"])
+        body = json.loads(bedrock_client.invoke_model.call_args.kwargs["body"])
+        assert body["dimensions"] == 512 and body["normalize"] is True
+
+    def test_optimized_performance_config_is_sent_to_supported_models(
+        self, bedrock_client, mocker
+    ):
+        mocker.patch(
+            "semantic_router.encoders.bedrock.LATENCY_OPTIMIZED_MODELS",
+            {"amazon.titan-embed-text-v2:0"},
+        )
+        encoder = BedrockEncoder(
+            performance_config="optimized",
+            aws_access_key_id="test_id",
+            aws_secret_access_key="test_key",
+        )
+        encoder(["test"])
+        kwargs = bedrock_client.invoke_model.call_args.kwargs
+        assert kwargs["performanceConfigLatency"] == "optimized"
+
+    def test_optimized_performance_config_is_dropped_for_unsupported_models(
+        self, bedrock_client
+    ):
+        encoder = BedrockEncoder(
+            performance_config="optimized",
+            aws_access_key_id="test_id",
+            aws_secret_access_key="test_key",
+        )
+        encoder(["test"])
+        kwargs = bedrock_client.invoke_model.call_args.kwargs
+        assert "performanceConfigLatency" not in kwargs
+
+    def test_standard_performance_config_is_always_sent(self, bedrock_client):
+        encoder = BedrockEncoder(
+            performance_config="standard",
+            aws_access_key_id="test_id",
+            aws_secret_access_key="test_key",
+        )
+        encoder(["test"])
+        kwargs = bedrock_client.invoke_model.call_args.kwargs
+        assert kwargs["performanceConfigLatency"] == "standard"
+
+    def test_call_method(self, bedrock_encoder, bedrock_client):
+        result = bedrock_encoder(["a", "bbb", "cc"])
+        assert isinstance(result, np.ndarray), "Result should be an array"
+        assert result.dtype == np.float32
+        assert result.shape == (3, 2)
+        assert result[:, 0].tolist() == [1.0, 3.0, 2.0], "Input order not preserved"
+        body = json.loads(bedrock_client.invoke_model.call_args.kwargs["body"])
+        assert body["dimensions"] == 512 and body["normalize"] is True
+
+    def test_raises_value_error_for_unsupported_titan_v2_dimensions(
+        self, bedrock_client
+    ):
+        with pytest.raises(ValueError):
+            BedrockEncoder(
+                dimensions=1536,
+                aws_access_key_id="test_id",
+                aws_secret_access_key="test_key",
+            )
+
+    def test_call_method_titan_v1_ignores_dimensions(self, bedrock_client):
+        encoder = BedrockEncoder(
+            model_id="amazon.titan-embed-text-v1",
+            dimensions=1536,
+            aws_access_key_id="test_id",
+            aws_secret_access_key="test_key",
+        )
+        encoder(["test"])
+        body = json.loads(bedrock_client.invoke_model.call_args.kwargs["body"])
+        assert body == {"inputText": "test"}
+
+    def test_embedding_type_cannot_be_reassigned(self, cohere_encoder, bedrock_client):
+        with pytest.raises(TypeError):
+            cohere_encoder.embedding_type = "int8"
+        cohere_encoder(["test"])
+        body = json.loads(bedrock_client.invoke_model.call_args.kwargs["body"])
+        assert "embedding_types" not in body
+
+    def test_call_method_batches_cohere_documents(self, cohere_encoder, bedrock_client):
+        docs = [f"doc {i}" for i in range(200)]
+        result = cohere_encoder(docs)
+        assert result.shape == (200, 2)
+        assert bedrock_client.invoke_model.call_count == 3
+        body = json.loads(bedrock_client.invoke_model.call_args.kwargs["body"])
+        assert body["input_type"] == "search_document"
+
+    def test_query_uses_search_query_input_type(self, cohere_encoder, bedrock_client):
+        cohere_encoder.query(["test"])
+        body = json.loads(bedrock_client.invoke_model.call_args.kwargs["body"])
+        assert body["input_type"] == "search_query"
+
+    def test_call_method_casts_int8_embeddings(self, bedrock_client):
+        encoder = BedrockEncoder(
+            model_id="cohere.embed-english-v3",
+            embedding_type="int8",
+            aws_access_key_id="test_id",
+            aws_secret_access_key="test_key",
+        )
+        bedrock_client.invoke_model.side_effect = None
+        bedrock_client.invoke_model.return_value = {
+            "body": io.BytesIO(
+                json.dumps({"embeddings": {"int8": [[1, -2], [127, -128]]}}).encode()
+            )
+        }
+        result = encoder(["a", "b"])
+        body = json.loads(bedrock_client.invoke_model.call_args.kwargs["body"])
+        assert body["embedding_types"] == ["int8"]
+        assert result.dtype == np.float32
+        assert result.tolist() == [[1.0, -2.0], [127.0, -128.0]]
+
+    def test_call_method_rejects_long_cohere_documents(
+        self, cohere_encoder, bedrock_client
+    ):
+        with pytest.raises(ValueError):
+            cohere_encoder(["test", "x" * 2049])
+        bedrock_client.invoke_model.assert_not_called()
+
+    def test_call_method_rejects_empty_documents(self, bedrock_encoder, bedrock_client):
+        with pytest.raises(ValueError):
+            bedrock_encoder(["test", ""])
+        bedrock_client.invoke_model.assert_not_called()
+
+    def test_call_method_uses_cache(self, bedrock_encoder, bedrock_client):
+        bedrock_encoder(["test1", "test2", "test1"])
+        assert bedrock_client.invoke_model.call_count == 2
+        result = bedrock_encoder(["test2"])
+        assert bedrock_client.invoke_model.call_count == 2
+        assert result.shape == (1, 2)
+
+    def test_query_shares_cache_with_titan_documents(
+        self, bedrock_encoder, bedrock_client
+    ):
+        bedrock_encoder(["test"])
+        bedrock_encoder.query(["test"])
+        assert bedrock_client.invoke_model.call_count == 1
+
+    def test_query_does_not_share_cache_with_cohere_documents(
+        self, cohere_encoder, bedrock_client
+    ):
+        cohere_encoder(["test"])
+        cohere_encoder.query(["test"])
+        assert bedrock_client.invoke_model.call_count == 2
+
+    def test_call_method_decodes_base64_embeddings(
+        self, bedrock_encoder, bedrock_client
+    ):
+        vector = np.array([0.5, -1.0, 2.0], dtype="<f4")
+        encoded = base64.b64encode(vector.tobytes()).decode()
+        bedrock_client.invoke_model.side_effect = None
+        bedrock_client.invoke_model.return_value = {
+            "body": io.BytesIO(json.dumps({"embeddingBase64": encoded}).encode())
+        }
+        result = bedrock_encoder(["test"])
+        assert np.array_equal(result[0], vector)
+
+    def test_call_method_raises_error_on_api_failure(
+        self, bedrock_encoder, bedrock_client
+    ):
+        bedrock_client.invoke_model.side_effect = Exception("API call failed")
+        with pytest.raises(ValueError):
+            bedrock_encoder(["test"])
+
+    def test_acall_method(self, bedrock_encoder, mocker):
+        async def invoke_model(**kwargs):
+            response = mock_invoke_model(**kwargs)
+            body = mocker.AsyncMock()
+            body.read.return_value = response["body"].read()
+            return {"body": body}
+
+        async_client = mocker.AsyncMock()
+        async_client.__aenter__.return_value = async_client
+        async_client.invoke_model.side_effect = invoke_model
+        bedrock_encoder._async_session = mocker.MagicMock()
+        bedrock_encoder._async_session.client.return_value = async_client
+
+        result = asyncio.run(bedrock_encoder.acall(["a", "bbb", "cc"]))
+        assert result.dtype == np.float32
+        assert result[:, 0].tolist() == [1.0, 3.0, 2.0], "Input order not preserved"
+        assert async_client.invoke_model.call_count == 3
@@ -3,6 +3,7 @@ import os
 import tempfile
 from unittest.mock import mock_open, patch
 
+import numpy as np
 import pytest
 import time
 
@@ -24,7 +25,9 @@ def mock_encoder_call(utterances):
         "Bye": [1.0, 1.1, 1.2],
         "Au revoir": [1.3, 1.4, 1.5],
     }
-    return [mock_responses.get(u, [0.0, 0.0, 0.0]) for u in utterances]
+    return np.asarray(
+        [mock_responses.get(u, [0.0, 0.0, 0.0]) for u in utterances], dtype=np.float32
+    )
 
 
 def layer_json():
@@ -337,7 +340,7 @@ class TestRouteLayer:
             ]
         )
         assert classification == "Route 1"
-        assert score == [0.9]
+        assert np.allclose(score, [0.9])
 
     def test_semantic_classify_multiple_routes(self, openai_encoder, routes, index_cls):
         route_layer = RouteLayer(
@@ -351,7 +354,7 @@ class TestRouteLayer:
             ]
         )
         assert classification == "Route 1"
-        assert score == [0.9, 0.8]
+        assert np.allclose(score, [0.9, 0.8])
 
     def test_query_no_text_dynamic_route(
         self, openai_encoder, dynamic_routes, index_cls
@@ -367,6 +370,8 @@ class TestRouteLayer:
         route_layer = RouteLayer(encoder=openai_encoder, index=index_cls())
         assert not route_layer._pass_threshold([], 0.5)
         assert route_layer._pass_threshold([0.6, 0.7], 0.5)
+        assert not route_layer._pass_threshold(np.array([]), 0.5)
+        assert route_layer._pass_threshold(np.array([0.6, 0.7]), 0.5)
 
     def test_failover_score_threshold(self, base_encoder, index_cls):
         route_layer = RouteLayer(encoder=base_encoder, index=index_cls())
@@ -810,10 +815,10 @@ class TestLayerConfig:
 
             if agg == "sum":
                 assert classification == "Route 1"
-                assert score == [0.5, 0.5, 0.5, 0.5]
+                assert np.allclose(score, [0.5, 0.5, 0.5, 0.5])
             elif agg == "mean":
                 assert classification == "Route 2"
-                assert score == [0.4, 0.6, 0.8]
+                assert np.allclose(score, [0.4, 0.6, 0.8])
             elif agg == "max":
                 assert classification == "Route 3"
-                assert score == [0.1, 1.0]
+                assert np.allclose(score, [0.1, 1.0])